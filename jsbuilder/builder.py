@@ -127,6 +127,12 @@ class JsonSchemaNode(object):
     def from_python(cls, obj):
         return DefaultJsonSchemaResolver.get_instance().resolve(obj)
 
+    @classmethod
+    def from_samples(cls, samples, **options):
+        from jsbuilder.inference import infer_from_samples
+
+        return infer_from_samples(samples, **options)
+
     @property
     def resolver(self):
         return (
@@ -156,6 +162,9 @@ class JsonSchemaNull(JsonSchemaNode):
     def is_native(self):
         return True
 
+    def __eq__(self, other):
+        return isinstance(other, JsonSchemaNull)
+
 
 class JsonSchemaRef(JsonSchemaNode):
     def __init__(self, ref_name: str, root: str = "#/definitions/"):
@@ -218,6 +227,12 @@ class JsonSchemaObject(JsonSchemaNode):
 
         return schema_obj
 
+    @classmethod
+    def from_columns(cls, batch, **options):
+        from jsbuilder.inference import infer_from_columns
+
+        return infer_from_columns(batch, **options)
+
     def __init__(self, properties: list = None):
         self._properties = properties or {}
 
@@ -280,46 +295,121 @@ class JsonSchemaArray(JsonSchemaNode):
 
 
 class JsonSchemaNumber(JsonSchemaNode):
-    def __init__(self, exact_type: str = None, multipleOf: int = None):
+    def __init__(
+        self,
+        exact_type: str = None,
+        multipleOf: (int, float) = None,
+        minimum: (int, float) = None,
+        maximum: (int, float) = None,
+        enum: list = None,
+    ):
         self._exact_type = exact_type if exact_type is not None else "number"
         assert self._exact_type in ["integer", "number"]
         if multipleOf is not None:
             assert multipleOf > 0  # must be a positive number
         self._multiple_of = multipleOf
+        self._minimum = minimum
+        self._maximum = maximum
+        self._enum = enum
 
     def render(self):
         descr = {"type": self._exact_type}
         if self._multiple_of is not None:
             descr["multipleOf"] = self._multiple_of
+        if self._minimum is not None:
+            descr["minimum"] = self._minimum
+        if self._maximum is not None:
+            descr["maximum"] = self._maximum
+        if self._enum is not None:
+            descr["enum"] = list(self._enum)
         return descr
 
     def is_native(self):
         return True
 
     def __eq__(self, other):
-        return isinstance(other, JsonSchemaNumber)
+        if not isinstance(other, JsonSchemaNumber):
+            return False
+
+        return (
+            self._exact_type == other._exact_type
+            and self._multiple_of == other._multiple_of
+            and self._minimum == other._minimum
+            and self._maximum == other._maximum
+            and self._enum == other._enum
+        )
 
 
 class JsonSchemaInteger(JsonSchemaNode):
+    def __init__(
+        self,
+        multipleOf: int = None,
+        minimum: int = None,
+        maximum: int = None,
+        enum: list = None,
+    ):
+        if multipleOf is not None:
+            assert multipleOf > 0  # must be a positive number
+        self._multiple_of = multipleOf
+        self._minimum = minimum
+        self._maximum = maximum
+        self._enum = enum
+
     def render(self):
-        return {"type": "integer"}
+        descr = {"type": "integer"}
+        if self._multiple_of is not None:
+            descr["multipleOf"] = self._multiple_of
+        if self._minimum is not None:
+            descr["minimum"] = self._minimum
+        if self._maximum is not None:
+            descr["maximum"] = self._maximum
+        if self._enum is not None:
+            descr["enum"] = list(self._enum)
+        return descr
 
     def is_native(self):
         return True
 
     def __eq__(self, other):
-        return isinstance(other, JsonSchemaInteger)
+        if not isinstance(other, JsonSchemaInteger):
+            return False
+
+        return (
+            self._multiple_of == other._multiple_of
+            and self._minimum == other._minimum
+            and self._maximum == other._maximum
+            and self._enum == other._enum
+        )
 
 
 class JsonSchemaString(JsonSchemaNode):
+    def __init__(self, minLength: int = None, maxLength: int = None, enum: list = None):
+        self._min_length = minLength
+        self._max_length = maxLength
+        self._enum = enum
+
     def render(self):
-        return {"type": "string"}
+        descr = {"type": "string"}
+        if self._min_length is not None:
+            descr["minLength"] = self._min_length
+        if self._max_length is not None:
+            descr["maxLength"] = self._max_length
+        if self._enum is not None:
+            descr["enum"] = list(self._enum)
+        return descr
 
     def is_native(self):
         return True
 
     def __eq__(self, other):
-        return isinstance(other, JsonSchemaString)
+        if not isinstance(other, JsonSchemaString):
+            return False
+
+        return (
+            self._min_length == other._min_length
+            and self._max_length == other._max_length
+            and self._enum == other._enum
+        )
 
 
 class JsonSchemaBoolean(JsonSchemaNode):
@@ -333,6 +423,24 @@ class JsonSchemaBoolean(JsonSchemaNode):
         return isinstance(other, JsonSchemaBoolean)
 
 
+class JsonSchemaAnyOf(JsonSchemaNode):
+    def __init__(self, nodes: list):
+        assert len(nodes) > 0
+        self._nodes = nodes
+
+    def render(self):
+        return {"anyOf": [node.render() for node in self._nodes]}
+
+    def is_native(self):
+        return all(node.is_native() for node in self._nodes)
+
+    def __eq__(self, other):
+        if not isinstance(other, JsonSchemaAnyOf):
+            return False
+
+        return self._nodes == other._nodes
+
+
 native_jsonschema_map = {
     NativeJsonschemaTypes.string: JsonSchemaString(),
     NativeJsonschemaTypes.number: JsonSchemaNumber(),
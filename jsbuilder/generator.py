@@ -0,0 +1,352 @@
+import json
+import math
+import random
+import string
+
+from fractions import Fraction
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+
+from jsbuilder.builder import JsonSchemaAnyOf
+from jsbuilder.builder import JsonSchemaArray
+from jsbuilder.builder import JsonSchemaBoolean
+from jsbuilder.builder import JsonSchemaBuilder
+from jsbuilder.builder import JsonSchemaInteger
+from jsbuilder.builder import JsonSchemaNode
+from jsbuilder.builder import JsonSchemaNull
+from jsbuilder.builder import JsonSchemaNumber
+from jsbuilder.builder import JsonSchemaObject
+from jsbuilder.builder import JsonSchemaRef
+from jsbuilder.builder import JsonSchemaString
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+DEFAULT_NUMBER_SPAN = 1000
+DEFAULT_MAX_STRING_LENGTH = 16
+DEFAULT_MAX_ARRAY_LENGTH = 4
+MAX_REDRAW_ROUNDS = 100
+STRING_ALPHABET = string.ascii_letters + string.digits
+
+_JSON_BOOLEANS = {False: "false", True: "true"}
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_value(value) -> str:
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return _JSON_BOOLEANS[value]
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return _encode_json(value)
+
+
+class _PythonBackend(object):
+    def __init__(self, seed):
+        self._random = random.Random(seed)
+
+    def integers(self, low: int, high: int, num: int) -> list:
+        randint = self._random.randint
+        return [randint(low, high) for _ in range(num)]
+
+    def uniform(self, low: float, high: float, num: int) -> list:
+        uniform = self._random.uniform
+        return [uniform(low, high) for _ in range(num)]
+
+    def booleans(self, num: int) -> list:
+        rand = self._random.random
+        return [rand() < 0.5 for _ in range(num)]
+
+    def characters(self, alphabet: str, num: int) -> str:
+        return "".join(self._random.choices(alphabet, k=num))
+
+
+class _NumpyBackend(object):
+    def __init__(self, seed):
+        self._random = np.random.default_rng(seed)
+
+    def integers(self, low: int, high: int, num: int) -> list:
+        return self._random.integers(low, high, size=num, endpoint=True).tolist()
+
+    def uniform(self, low: float, high: float, num: int) -> list:
+        return self._random.uniform(low, high, size=num).tolist()
+
+    def booleans(self, num: int) -> list:
+        return (self._random.random(num) < 0.5).tolist()
+
+    def characters(self, alphabet: str, num: int) -> str:
+        codes = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+        indices = self._random.integers(0, len(codes), size=num)
+        return codes[indices].tobytes().decode("ascii")
+
+
+def _bounds(minimum, maximum, step=None):
+    span = DEFAULT_NUMBER_SPAN if step is None else max(DEFAULT_NUMBER_SPAN, step)
+    if minimum is None and maximum is None:
+        return 0, span
+    if minimum is None:
+        return maximum - span, maximum
+    if maximum is None:
+        return minimum, minimum + span
+    return minimum, maximum
+
+
+def _is_binary_exact(value: float) -> bool:
+    # multiples of exact binary fractions such as 0.25 are exact as well
+    return Fraction(repr(value)) == Fraction(value)
+
+
+def _is_valid_multiple(value, multiple_of: float, low, high) -> bool:
+    # Validators check a float multipleOf by dividing in float arithmetic, so
+    # some exact decimal multiples such as 3 * 0.1 are rejected.
+    if not low <= value <= high:
+        return False
+    quotient = value / multiple_of
+    return quotient == int(quotient)
+
+
+class JsonSchemaInstanceGenerator(object):
+    """
+    Generates random instances which are valid against a schema node.
+
+    Instances are generated column-wise, i.e. all values of a property for a
+    batch at once, so numeric columns can be drawn with vectorized numpy calls
+    when use_numpy is set. References are looked up in the given definitions
+    or, for a JsonSchemaBuilder, in the definitions of the builder. Once
+    max_depth references have been followed, properties and anyOf options
+    which are references are left out so recursive definitions terminate.
+    """
+
+    def __init__(
+        self,
+        node: JsonSchemaNode,
+        definitions: dict = None,
+        seed: int = None,
+        use_numpy: bool = False,
+        max_depth: int = 8,
+    ):
+        if use_numpy and np is None:
+            raise ImportError("Generating with use_numpy=True requires numpy.")
+
+        self._node = node
+        if definitions is None and isinstance(node, JsonSchemaBuilder):
+            definitions = node._definitions
+        self._definitions = definitions if definitions is not None else {}
+        self._backend = _NumpyBackend(seed) if use_numpy else _PythonBackend(seed)
+        self._max_depth = max_depth
+
+    def generate(self):
+        return self.generate_many(1)[0]
+
+    def generate_many(self, num: int) -> list:
+        return self._generate(self._node, num, 0)
+
+    def write_ndjson(self, handle, num: int, batch_size: int = 10000) -> int:
+        """
+        Writes num newline-delimited json instances to a text handle.
+        Returns the number of written instances. Flat objects of scalars reach
+        a few hundred thousand instances per second, deeply nested objects,
+        anyOf and arrays are considerably slower.
+        """
+        num_written = 0
+        while num_written < num:
+            batch = self.generate_many(min(batch_size, num - num_written))
+            handle.write("\n".join(self._encode(self._node, batch)))
+            handle.write("\n")
+            num_written += len(batch)
+        return num_written
+
+    def _generate(self, node: JsonSchemaNode, num: int, depth: int) -> list:
+        if isinstance(node, JsonSchemaRef):
+            if depth >= self._max_depth:
+                raise ValueError(
+                    "Reference <{name}> exceeds maximum depth <{depth}>.".format(
+                        name=node._ref_name, depth=self._max_depth
+                    )
+                )
+            return self._generate(self._resolve_ref(node), num, depth + 1)
+        if isinstance(node, JsonSchemaObject):
+            return self._generate_objects(node, num, depth)
+        if isinstance(node, JsonSchemaAnyOf):
+            return self._generate_any_of(node, num, depth)
+        if isinstance(node, JsonSchemaNull):
+            return [None] * num
+        if isinstance(node, JsonSchemaBoolean):
+            return self._backend.booleans(num)
+        if isinstance(node, JsonSchemaInteger):
+            return self._generate_numbers(node, num, integral=True)
+        if isinstance(node, JsonSchemaNumber):
+            integral = node._exact_type == "integer"
+            return self._generate_numbers(node, num, integral=integral)
+        if isinstance(node, JsonSchemaString):
+            return self._generate_strings(node, num)
+        if isinstance(node, JsonSchemaArray):
+            return self._generate_arrays(num)
+
+        raise TypeError(
+            "Can not generate instances for node <{node}>".format(node=node)
+        )
+
+    def _encode(self, node: JsonSchemaNode, values: list) -> list:
+        """
+        Encodes generated values column-wise into compact json strings, with
+        a string template per object instead of a json.dumps call per row.
+        """
+        if isinstance(node, JsonSchemaRef):
+            return self._encode(self._resolve_ref(node), values)
+        if isinstance(node, JsonSchemaObject):
+            return self._encode_objects(node, values)
+        if isinstance(node, JsonSchemaBoolean):
+            return [_JSON_BOOLEANS[value] for value in values]
+        if isinstance(node, (JsonSchemaInteger, JsonSchemaNumber)):
+            return list(map(repr, values))
+        if isinstance(node, JsonSchemaString):
+            return list(map(encode_basestring_ascii, values))
+        if isinstance(node, JsonSchemaArray):
+            return ["[" + ",".join(map(repr, value)) + "]" for value in values]
+        return list(map(_encode_value, values))
+
+    def _encode_objects(self, node: JsonSchemaObject, values: list) -> list:
+        if len(values) == 0:
+            return []
+        # all objects of a column are generated with the same properties
+        names = list(values[0])
+        template = (
+            "{"
+            + ",".join(
+                encode_basestring_ascii(name).replace("%", "%%") + ":%s"
+                for name in names
+            )
+            + "}"
+        )
+        columns = [
+            self._encode(node._properties[name], list(map(itemgetter(name), values)))
+            for name in names
+        ]
+        if len(columns) == 0:
+            return [template] * len(values)
+        return [template % row for row in zip(*columns)]
+
+    def _resolve_ref(self, ref: JsonSchemaRef) -> JsonSchemaNode:
+        if ref._ref_name not in self._definitions:
+            raise TypeError(
+                "Could not find definition <{name}> for reference.".format(
+                    name=ref._ref_name
+                )
+            )
+        return self._definitions[ref._ref_name]
+
+    def _generate_objects(self, node: JsonSchemaObject, num: int, depth: int) -> list:
+        names = [
+            name
+            for name in node._properties
+            if depth < self._max_depth
+            or not isinstance(node._properties[name], JsonSchemaRef)
+        ]
+        if len(names) == 0:
+            return [{} for _ in range(num)]
+        columns = [self._generate(node._properties[name], num, depth) for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def _generate_any_of(self, node: JsonSchemaAnyOf, num: int, depth: int) -> list:
+        options = node._nodes
+        if depth >= self._max_depth:
+            options = [o for o in options if not isinstance(o, JsonSchemaRef)]
+            options = options or node._nodes
+        choices = self._backend.integers(0, len(options) - 1, num)
+        counts = [0] * len(options)
+        for choice in choices:
+            counts[choice] += 1
+        columns = [
+            iter(self._generate(option, count, depth))
+            for option, count in zip(options, counts)
+        ]
+        return [next(columns[choice]) for choice in choices]
+
+    def _generate_enum(self, enum: list, num: int) -> list:
+        indices = self._backend.integers(0, len(enum) - 1, num)
+        return [enum[idx] for idx in indices]
+
+    def _generate_numbers(self, node: JsonSchemaNode, num: int, integral: bool):
+        if node._enum is not None:
+            return self._generate_enum(list(node._enum), num)
+
+        multiple_of = node._multiple_of
+        step = multiple_of
+        if integral:
+            # least common multiple of 1 and multipleOf
+            step = 1 if multiple_of is None else Fraction(repr(step)).numerator
+        low, high = _bounds(node._minimum, node._maximum, step)
+        if step is None:
+            return self._backend.uniform(low, high, num)
+
+        low_factor = math.ceil(low / step)
+        high_factor = math.floor(high / step)
+        if low_factor > high_factor:
+            raise ValueError(
+                "No multiple of <{m}> within [{low}, {high}].".format(
+                    m=step, low=low, high=high
+                )
+            )
+        factors = self._backend.integers(low_factor, high_factor, num)
+        values = factors if step == 1 else [factor * step for factor in factors]
+        if not isinstance(multiple_of, float) or _is_binary_exact(multiple_of):
+            return values
+
+        invalid = [
+            idx
+            for idx, value in enumerate(values)
+            if not _is_valid_multiple(value, multiple_of, low, high)
+        ]
+        for _ in range(MAX_REDRAW_ROUNDS):
+            if len(invalid) == 0:
+                return values
+            factors = self._backend.integers(low_factor, high_factor, len(invalid))
+            for idx, factor in zip(invalid, factors):
+                values[idx] = factor * step
+            invalid = [
+                idx
+                for idx in invalid
+                if not _is_valid_multiple(values[idx], multiple_of, low, high)
+            ]
+        raise ValueError(
+            "Could not draw valid multiples of <{m}> within [{low}, {high}].".format(
+                m=multiple_of, low=low, high=high
+            )
+        )
+
+    def _generate_strings(self, node: JsonSchemaString, num: int) -> list:
+        if node._enum is not None:
+            return self._generate_enum(list(node._enum), num)
+
+        min_length = node._min_length if node._min_length is not None else 0
+        max_length = (
+            node._max_length
+            if node._max_length is not None
+            else max(min_length, DEFAULT_MAX_STRING_LENGTH)
+        )
+        lengths = self._backend.integers(min_length, max_length, num)
+        pool = self._backend.characters(STRING_ALPHABET, sum(lengths))
+        strings = []
+        offset = 0
+        for length in lengths:
+            strings.append(pool[offset : offset + length])
+            offset += length
+        return strings
+
+    def _generate_arrays(self, num: int) -> list:
+        lengths = self._backend.integers(0, DEFAULT_MAX_ARRAY_LENGTH, num)
+        items = self._backend.integers(0, DEFAULT_NUMBER_SPAN, sum(lengths))
+        arrays = []
+        offset = 0
+        for length in lengths:
+            arrays.append(items[offset : offset + length])
+            offset += length
+        return arrays
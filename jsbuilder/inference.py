@@ -0,0 +1,493 @@
+import math
+
+from fractions import Fraction
+from itertools import repeat
+
+from jsbuilder.builder import JsonSchemaAnyOf
+from jsbuilder.builder import JsonSchemaArray
+from jsbuilder.builder import JsonSchemaBoolean
+from jsbuilder.builder import JsonSchemaInteger
+from jsbuilder.builder import JsonSchemaNull
+from jsbuilder.builder import JsonSchemaNumber
+from jsbuilder.builder import JsonSchemaObject
+from jsbuilder.builder import JsonSchemaString
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_MASK64 = (1 << 64) - 1
+_ARRAY_KINDS = {bool: "b", int: "iu", float: "f", str: "U"}
+
+
+def _hash64(value) -> int:
+    # splitmix64 finalizer; python hashes of small ints are the ints themselves
+    h = hash((type(value).__name__, value)) & _MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+def _fraction_gcd(a: Fraction, b: Fraction) -> Fraction:
+    return Fraction(
+        math.gcd(a.numerator * b.denominator, b.numerator * a.denominator),
+        a.denominator * b.denominator,
+    )
+
+
+def _divisor_to_multiple_of(divisor: Fraction):
+    # Floats are exact binary fractions, so any divisor which passed the
+    # denominator bound is exactly representable and safe to validate with.
+    if divisor is None or divisor == 0 or divisor == 1:
+        return None
+    if divisor.denominator == 1:
+        return divisor.numerator
+    return float(divisor)
+
+
+def _is_enum(num_distinct: int, num_values: int, enum_cutoff: int) -> bool:
+    # Every distinct value has to be seen twice on average to count as enum
+    return 0 < num_distinct <= enum_cutoff and 2 * num_distinct <= num_values
+
+
+class DistinctCountSketch(object):
+    """
+    HyperLogLog estimate of the number of distinct values added.
+    Memory is fixed to 2**precision single-byte registers.
+    """
+
+    def __init__(self, precision: int = 10):
+        assert 4 <= precision <= 16
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value):
+        h = _hash64(value)
+        index = h >> (64 - self._precision)
+        width = 64 - self._precision
+        rank = width - (h & ((1 << width) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def estimate(self) -> int:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class ValueStatistics(object):
+    """
+    Streaming statistics over all values observed for a single property.
+
+    Keeps type counts, numeric range, the greatest common divisor of numbers,
+    string length bounds and a distinct-count sketch. Exact values are only
+    remembered until more than enum_cutoff distinct ones have been seen, so
+    memory stays constant regardless of the number of samples.
+    """
+
+    def __init__(
+        self, enum_cutoff: int = 10, max_denominator: int = 1024, precision: int = 10
+    ):
+        self._enum_cutoff = enum_cutoff
+        self._max_denominator = max_denominator
+        self._precision = precision
+
+        self._count = 0
+        self._type_counts = {}
+        self._minimum = None
+        self._maximum = None
+        self._divisor = Fraction(0)
+        self._min_length = None
+        self._max_length = None
+        self._values = set()
+        self._sketch = DistinctCountSketch(precision)
+        self._object = None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def distinct_count(self) -> int:
+        if self._values is not None:
+            return len(self._values)
+        return self._sketch.estimate()
+
+    def update(self, value):
+        self._count += 1
+        if value is None or (isinstance(value, float) and not math.isfinite(value)):
+            # NaN and infinity can not be represented in json, treat them as null
+            self._count_type("null")
+        elif isinstance(value, bool):
+            self._count_type("boolean")
+        elif isinstance(value, int):
+            self._count_type("integer")
+            self._update_number(value)
+            self._update_distinct(value)
+        elif isinstance(value, float):
+            self._count_type("number")
+            self._update_number(value)
+            self._update_distinct(value)
+        elif isinstance(value, str):
+            self._count_type("string")
+            self._update_string(value)
+            self._update_distinct(value)
+        elif isinstance(value, dict):
+            self._count_type("object")
+            if self._object is None:
+                self._object = ObjectStatistics(
+                    enum_cutoff=self._enum_cutoff,
+                    max_denominator=self._max_denominator,
+                    precision=self._precision,
+                )
+            self._object.update(value)
+        elif isinstance(value, (list, tuple)):
+            self._count_type("array")
+        else:
+            raise TypeError(
+                "Can not infer a schema type for value <{v}> of type <{T}>".format(
+                    v=value, T=type(value).__name__
+                )
+            )
+
+    def to_node(self):
+        nodes = []
+        if "object" in self._type_counts:
+            nodes.append(self._object.to_node())
+        if "array" in self._type_counts:
+            nodes.append(JsonSchemaArray())
+        if "string" in self._type_counts:
+            nodes.append(
+                JsonSchemaString(
+                    minLength=self._min_length,
+                    maxLength=self._max_length,
+                    enum=self._enum_for("string"),
+                )
+            )
+        if "number" in self._type_counts:
+            nodes.append(
+                JsonSchemaNumber(
+                    multipleOf=self._multiple_of(),
+                    minimum=self._minimum,
+                    maximum=self._maximum,
+                    enum=self._enum_for("number", "integer"),
+                )
+            )
+        elif "integer" in self._type_counts:
+            nodes.append(
+                JsonSchemaInteger(
+                    multipleOf=self._multiple_of(),
+                    minimum=self._minimum,
+                    maximum=self._maximum,
+                    enum=self._enum_for("integer"),
+                )
+            )
+        if "boolean" in self._type_counts:
+            nodes.append(JsonSchemaBoolean())
+        if "null" in self._type_counts:
+            nodes.append(JsonSchemaNull())
+
+        if len(nodes) == 0:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+        return JsonSchemaAnyOf(nodes)
+
+    def _count_type(self, name: str):
+        self._type_counts[name] = self._type_counts.get(name, 0) + 1
+
+    def _update_number(self, value):
+        if self._minimum is None or value < self._minimum:
+            self._minimum = value
+        if self._maximum is None or value > self._maximum:
+            self._maximum = value
+
+        if self._divisor is not None:
+            self._divisor = _fraction_gcd(self._divisor, Fraction(value))
+            if self._divisor.denominator > self._max_denominator:
+                self._divisor = None
+
+    def _update_string(self, value: str):
+        length = len(value)
+        if self._min_length is None or length < self._min_length:
+            self._min_length = length
+        if self._max_length is None or length > self._max_length:
+            self._max_length = length
+
+    def _update_distinct(self, value):
+        self._sketch.add(value)
+        if self._values is not None:
+            self._values.add(value)
+            if len(self._values) > self._enum_cutoff:
+                self._values = None
+
+    def _multiple_of(self):
+        return _divisor_to_multiple_of(self._divisor)
+
+    def _enum_for(self, *type_names):
+        """
+        Values are only reported as enum if no other enum-able type has been
+        observed besides the given ones.
+        """
+        if self._values is None:
+            return None
+        enum_types = {"integer", "number", "string"}
+        if any(t not in type_names for t in enum_types & set(self._type_counts)):
+            return None
+        num_values = sum(self._type_counts.get(t, 0) for t in type_names)
+        if not _is_enum(len(self._values), num_values, self._enum_cutoff):
+            return None
+        return sorted(self._values)
+
+
+class ObjectStatistics(object):
+    """
+    Streaming statistics for dictionary samples, kept per property name.
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._count = 0
+        self._properties = {}
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def properties(self) -> dict:
+        return self._properties
+
+    def update(self, instance: dict):
+        self._count += 1
+        for name in instance:
+            if name not in self._properties:
+                self._properties[name] = ValueStatistics(**self._options)
+            self._properties[name].update(instance[name])
+
+    def to_node(self) -> JsonSchemaObject:
+        return JsonSchemaObject(
+            {name: self._properties[name].to_node() for name in self._properties}
+        )
+
+
+def infer_from_samples(
+    samples, enum_cutoff: int = 10, max_denominator: int = 1024, precision: int = 10
+):
+    """
+    Infers a schema node with constraints from an iterable of sample instances.
+    The samples are consumed in a single pass and never held in memory.
+    """
+    stats = ValueStatistics(
+        enum_cutoff=enum_cutoff, max_denominator=max_denominator, precision=precision
+    )
+    for sample in samples:
+        stats.update(sample)
+    return stats.to_node()
+
+
+def infer_from_columns(
+    batch, enum_cutoff: int = 10, max_denominator: int = 1024
+) -> JsonSchemaObject:
+    """
+    Infers an object schema from a columnar batch, i.e. a numpy structured array
+    or a dictionary of equal-length sequences. Columns of a single scalar type
+    are summarized with vectorized numpy operations, other columns fall back to
+    streaming statistics. Empty columns are left out and NaN and infinity are
+    treated as null, just as in infer_from_samples.
+    """
+    columns = _batch_columns(batch)
+    properties = {}
+    for name in columns:
+        node = _infer_column(columns[name], enum_cutoff, max_denominator)
+        if node is not None:
+            properties[name] = node
+    return JsonSchemaObject(properties)
+
+
+def _batch_columns(batch) -> dict:
+    if np is not None and isinstance(batch, np.ndarray):
+        if batch.dtype.names is None:
+            raise TypeError(
+                "Expected a structured array but got dtype <{dtype}>".format(
+                    dtype=batch.dtype
+                )
+            )
+        return {name: batch[name] for name in batch.dtype.names}
+
+    if not isinstance(batch, dict):
+        raise TypeError(
+            "Can not read columns from batch of type <{T}>".format(
+                T=type(batch).__name__
+            )
+        )
+    lengths = {len(batch[name]) for name in batch}
+    if len(lengths) > 1:
+        raise ValueError(
+            "Columns of a batch must have equal lengths but got <{lengths}>".format(
+                lengths=sorted(lengths)
+            )
+        )
+    return batch
+
+
+def _infer_column(column, enum_cutoff: int, max_denominator: int):
+    if len(column) == 0:
+        # Same as a property which never occurs in streamed samples
+        return None
+
+    values = None
+    is_int = None
+    num_nulls = 0
+    if np is not None:
+        if isinstance(column, np.ndarray) and column.dtype.kind != "O":
+            values = column
+        else:
+            if isinstance(column, np.ndarray):
+                column = column.tolist()
+            values, is_int, num_nulls = _sequence_to_array(column)
+        if values is not None and values.dtype.kind == "f":
+            non_finite = ~np.isfinite(values)
+            num_non_finite = int(np.count_nonzero(non_finite))
+            if num_non_finite > 0:
+                values = values[~non_finite]
+                is_int = is_int[~non_finite] if is_int is not None else None
+                num_nulls += num_non_finite
+
+    node = None
+    if values is not None:
+        if len(values) == 0 and num_nulls > 0:
+            return JsonSchemaNull()
+        node = _array_to_node(values, enum_cutoff, max_denominator, is_int)
+
+    if node is None:
+        stats = ValueStatistics(
+            enum_cutoff=enum_cutoff, max_denominator=max_denominator
+        )
+        for value in column:
+            stats.update(value)
+        return stats.to_node()
+
+    if num_nulls == 0:
+        return node
+    return JsonSchemaAnyOf([node, JsonSchemaNull()])
+
+
+def _sequence_to_array(sequence):
+    """
+    Converts a sequence of scalars of a single json type (and nulls) into an
+    array. Columns mixing integers and floats become float arrays with a mask
+    of the integer positions, so their values can be restored as integers.
+    Returns None instead of the array if numpy would change the values, e.g.
+    for other mixed types or integers beyond 64 bits.
+    """
+    kinds = set(map(type, sequence))
+    num_nulls = 0
+    if type(None) in kinds:
+        kinds.discard(type(None))
+        values = [value for value in sequence if value is not None]
+        num_nulls = len(sequence) - len(values)
+        sequence = values
+
+    if kinds == {int, float}:
+        values = np.asarray(sequence, dtype=float)
+        is_int = np.fromiter(
+            map(isinstance, sequence, repeat(int)), dtype=bool, count=len(sequence)
+        )
+        # Integers beyond 2 ** 53 can not be restored exactly from a float
+        if np.any(np.abs(values[is_int]) >= 2 ** 53):
+            return None, None, num_nulls
+        return values, is_int, num_nulls
+
+    if len(kinds) != 1:
+        return None, None, num_nulls
+    values = np.asarray(sequence)
+    if values.ndim != 1 or values.dtype.kind not in _ARRAY_KINDS.get(kinds.pop(), ""):
+        return None, None, num_nulls
+    return values, None, num_nulls
+
+
+def _array_to_node(values, enum_cutoff: int, max_denominator: int, is_int=None):
+    kind = values.dtype.kind
+    if kind == "b":
+        return JsonSchemaBoolean()
+
+    if kind in "iu":
+        if len(values) == 0:
+            return JsonSchemaInteger()
+        divisor = Fraction(int(np.gcd.reduce(values)))
+        return JsonSchemaInteger(
+            multipleOf=_divisor_to_multiple_of(divisor),
+            minimum=int(values.min()),
+            maximum=int(values.max()),
+            enum=_column_enum(values, enum_cutoff),
+        )
+
+    if kind == "f":
+        if len(values) == 0:
+            return JsonSchemaNumber()
+        divisor = _float_divisor(values, max_denominator)
+        return JsonSchemaNumber(
+            multipleOf=_divisor_to_multiple_of(divisor),
+            minimum=_restore_number(values, is_int, int(values.argmin())),
+            maximum=_restore_number(values, is_int, int(values.argmax())),
+            enum=_column_enum(values, enum_cutoff, is_int),
+        )
+
+    if kind in "US":
+        if kind == "S":
+            values = values.astype("U")
+        if len(values) == 0:
+            return JsonSchemaString()
+        lengths = np.char.str_len(values)
+        return JsonSchemaString(
+            minLength=int(lengths.min()),
+            maxLength=int(lengths.max()),
+            enum=_column_enum(values, enum_cutoff),
+        )
+
+    return None
+
+
+def _restore_number(values, is_int, index: int):
+    # Like the streaming statistics, the first occurrence decides the type
+    if is_int is not None and is_int[index]:
+        return int(values[index])
+    return float(values[index])
+
+
+def _float_divisor(values, max_denominator: int) -> (Fraction, None):
+    # Scaling by a power of two is exact, so this yields the same divisor as
+    # the fraction-based greatest common divisor of the streaming statistics.
+    scale = 1 << (max_denominator.bit_length() - 1)
+    scaled = values * scale
+    if np.any(scaled != np.floor(scaled)):
+        return None
+    if np.any(np.abs(scaled) >= 2 ** 63):
+        # Too large for int64, reduce the distinct values as fractions instead
+        divisor = Fraction(0)
+        for value in np.unique(values).tolist():
+            divisor = _fraction_gcd(divisor, Fraction(value))
+        return divisor if divisor.denominator <= max_denominator else None
+    return Fraction(int(np.gcd.reduce(scaled.astype(np.int64))), scale)
+
+
+def _column_enum(values, enum_cutoff: int, is_int=None):
+    # A prefix with too many distinct values rules out an enum without sorting
+    # the whole column.
+    prefix = values[: max(1024, 4 * enum_cutoff)]
+    if len(np.unique(prefix)) > enum_cutoff:
+        return None
+    distinct, first_indices = np.unique(values, return_index=True)
+    if not _is_enum(len(distinct), len(values), enum_cutoff):
+        return None
+    if is_int is None:
+        return distinct.tolist()
+    return [_restore_number(values, is_int, int(idx)) for idx in first_indices]
@@ -0,0 +1,129 @@
+import io
+import json
+
+import jsonschema
+import pytest
+
+from jsbuilder.builder import JsonSchemaAnyOf
+from jsbuilder.builder import JsonSchemaArray
+from jsbuilder.builder import JsonSchemaBoolean
+from jsbuilder.builder import JsonSchemaBuilder
+from jsbuilder.builder import JsonSchemaInteger
+from jsbuilder.builder import JsonSchemaNull
+from jsbuilder.builder import JsonSchemaNumber
+from jsbuilder.builder import JsonSchemaObject
+from jsbuilder.builder import JsonSchemaRef
+from jsbuilder.builder import JsonSchemaString
+from jsbuilder.generator import JsonSchemaInstanceGenerator
+
+
+def create_builder():
+    builder = JsonSchemaBuilder()
+    builder._definitions["Address"] = JsonSchemaObject(
+        {
+            "zip": JsonSchemaInteger(minimum=10000, maximum=99999),
+            "street": JsonSchemaString(minLength=3, maxLength=20),
+        }
+    )
+    builder._properties = {
+        "id": JsonSchemaInteger(multipleOf=3, minimum=0),
+        "price": JsonSchemaNumber(multipleOf=0.25, minimum=-5, maximum=5),
+        "ratio": JsonSchemaNumber(minimum=0, maximum=1),
+        "color": JsonSchemaString(enum=["red", "green", "blue"]),
+        "active": JsonSchemaBoolean(),
+        "tags": JsonSchemaArray(),
+        "nickname": JsonSchemaAnyOf([JsonSchemaString(), JsonSchemaNull()]),
+        "address": JsonSchemaRef("Address"),
+    }
+    return builder
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_generated_instances_are_valid(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    builder = create_builder()
+    generator = JsonSchemaInstanceGenerator(builder, seed=1, use_numpy=use_numpy)
+
+    instances = generator.generate_many(500)
+
+    validator = jsonschema.Draft7Validator(builder.render())
+    assert len(instances) == 500
+    for instance in instances:
+        validator.validate(instance)
+        assert instance["id"] % 3 == 0
+        assert instance["address"]["zip"] >= 10000
+
+
+def test_generator_is_seedable():
+    instances1 = JsonSchemaInstanceGenerator(create_builder(), seed=7).generate_many(10)
+    instances2 = JsonSchemaInstanceGenerator(create_builder(), seed=7).generate_many(10)
+
+    assert instances1 == instances2
+
+
+def test_generator_missing_definition():
+    generator = JsonSchemaInstanceGenerator(JsonSchemaRef("Unknown"))
+
+    with pytest.raises(TypeError):
+        generator.generate()
+
+
+def test_write_ndjson():
+    generator = JsonSchemaInstanceGenerator(create_builder(), seed=3)
+    handle = io.StringIO()
+
+    num_written = generator.write_ndjson(handle, 2500, batch_size=1000)
+
+    lines = handle.getvalue().splitlines()
+    assert num_written == 2500
+    assert len(lines) == 2500
+    assert all(isinstance(json.loads(line), dict) for line in lines)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "node",
+    [
+        JsonSchemaNumber(multipleOf=0.1, minimum=0, maximum=10),
+        JsonSchemaNumber(multipleOf=0.01),
+        JsonSchemaInteger(minimum=1, multipleOf=5000),
+        JsonSchemaNumber(exact_type="integer", multipleOf=0.5),
+        JsonSchemaNumber(exact_type="integer", multipleOf=0.1, maximum=-3),
+    ],
+)
+def test_generated_numbers_are_valid(node, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    generator = JsonSchemaInstanceGenerator(node, seed=5, use_numpy=use_numpy)
+
+    instances = generator.generate_many(1000)
+
+    validator = jsonschema.Draft7Validator(node.render())
+    assert all(validator.is_valid(instance) for instance in instances)
+
+
+def test_generator_recursive_definition():
+    definitions = {
+        "Node": JsonSchemaObject(
+            {"value": JsonSchemaInteger(), "child": JsonSchemaRef("Node")}
+        )
+    }
+    generator = JsonSchemaInstanceGenerator(
+        JsonSchemaRef("Node"), definitions=definitions, max_depth=3
+    )
+
+    instance = generator.generate()
+
+    assert "child" not in instance["child"]["child"]
+    assert "value" in instance["child"]["child"]
+
+
+def test_write_ndjson_matches_generated_instances():
+    handle = io.StringIO()
+    JsonSchemaInstanceGenerator(create_builder(), seed=11).write_ndjson(handle, 100)
+
+    instances = JsonSchemaInstanceGenerator(create_builder(), seed=11).generate_many(
+        100
+    )
+    assert [json.loads(line) for line in handle.getvalue().splitlines()] == instances
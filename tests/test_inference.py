@@ -0,0 +1,223 @@
+import json
+
+import jsonschema
+import pytest
+
+from jsbuilder.builder import JsonSchemaAnyOf
+from jsbuilder.builder import JsonSchemaNode
+from jsbuilder.builder import JsonSchemaObject
+from jsbuilder.inference import DistinctCountSketch
+from jsbuilder.inference import ObjectStatistics
+from jsbuilder.inference import infer_from_columns
+from jsbuilder.inference import infer_from_samples
+
+from .util import validate
+
+
+def generate_samples(num: int):
+    for idx in range(num):
+        yield {
+            "id": idx * 3,
+            "price": (idx % 40) * 0.25,
+            "name": "user-{idx}".format(idx=idx),
+            "color": ["red", "green", "blue"][idx % 3],
+            "nickname": None if idx % 2 == 0 else "nick",
+            "address": {"zip": 10000 + idx % 500},
+        }
+
+
+def test_infer_from_samples_constraints():
+    samples = list(generate_samples(1000))
+
+    node = JsonSchemaNode.from_samples(samples)
+    schema_instance = node.render()
+
+    validate(schema_instance)
+    assert isinstance(node, JsonSchemaObject)
+    properties = schema_instance["properties"]
+    assert properties["id"] == {
+        "type": "integer",
+        "multipleOf": 3,
+        "minimum": 0,
+        "maximum": 2997,
+    }
+    assert properties["price"] == {
+        "type": "number",
+        "multipleOf": 0.25,
+        "minimum": 0.0,
+        "maximum": 9.75,
+    }
+    assert properties["name"] == {"type": "string", "minLength": 6, "maxLength": 8}
+    assert properties["color"]["enum"] == ["blue", "green", "red"]
+    assert properties["address"]["properties"]["zip"]["minimum"] == 10000
+    validator = jsonschema.Draft7Validator(schema_instance)
+    for sample in samples:
+        validator.validate(sample)
+
+
+def test_infer_nullable_property_as_any_of():
+    node = infer_from_samples(generate_samples(10))
+
+    nickname = node._properties["nickname"]
+    assert isinstance(nickname, JsonSchemaAnyOf)
+    assert nickname.render() == {
+        "anyOf": [
+            {"type": "string", "minLength": 4, "maxLength": 4, "enum": ["nick"]},
+            {"type": "null"},
+        ]
+    }
+
+
+def test_infer_enum_cutoff():
+    node = infer_from_samples(({"n": idx % 20} for idx in range(200)), enum_cutoff=5)
+
+    assert "enum" not in node.render()["properties"]["n"]
+
+
+def test_object_statistics_bounded_distinct_values():
+    stats = ObjectStatistics(enum_cutoff=10)
+    for sample in generate_samples(5000):
+        stats.update(sample)
+
+    assert stats.count == 5000
+    assert stats.properties["color"].distinct_count == 3
+    assert abs(stats.properties["name"].distinct_count - 5000) < 500
+
+
+def test_distinct_count_sketch_estimate():
+    sketch = DistinctCountSketch(precision=12)
+    for idx in range(100000):
+        sketch.add(idx % 20000)
+
+    assert abs(sketch.estimate() - 20000) < 1000
+
+
+def generate_columns(num: int):
+    return {
+        "id": [idx * 3 for idx in range(num)],
+        "price": [(idx % 40) * 0.25 for idx in range(num)],
+        "color": [["red", "green", "blue"][idx % 3] for idx in range(num)],
+        "nickname": [None if idx % 2 == 0 else "nick" for idx in range(num)],
+        "active": [idx % 2 == 0 for idx in range(num)],
+        "mixed": [idx if idx % 2 == 0 else str(idx) for idx in range(num)],
+        "amount": [[1, 2.5][idx % 2] for idx in range(num)],
+        "ratio": [float("nan") if idx % 10 == 0 else idx / num for idx in range(num)],
+    }
+
+
+def test_infer_from_columns_equals_streaming_inference():
+    pytest.importorskip("numpy")
+    columns = generate_columns(1000)
+    samples = [{name: columns[name][idx] for name in columns} for idx in range(1000)]
+
+    node = JsonSchemaObject.from_columns(columns)
+
+    validate(node.render())
+    assert node.render() == infer_from_samples(samples).render()
+    assert node.render()["properties"]["amount"] == {
+        "type": "number",
+        "minimum": 1,
+        "maximum": 2.5,
+        "multipleOf": 0.5,
+        "enum": [1, 2.5],
+    }
+    assert node.render()["properties"]["ratio"]["anyOf"][1] == {"type": "null"}
+
+
+def test_infer_from_empty_columns_equals_streaming_inference():
+    np = pytest.importorskip("numpy")
+    empty_batch = np.zeros(0, dtype=[("id", "i8"), ("ratio", "f8")])
+
+    node = infer_from_columns({"id": [], "ratio": []})
+
+    assert node.render() == infer_from_samples([{}]).render()
+    assert infer_from_columns(empty_batch).render() == node.render()
+
+
+def test_infer_from_structured_array():
+    np = pytest.importorskip("numpy")
+    batch = np.zeros(
+        1000, dtype=[("id", "i8"), ("ratio", "f8"), ("code", "U4"), ("flag", "?")]
+    )
+    batch["id"] = np.arange(1000) * 4 - 400
+    batch["ratio"] = np.linspace(0, 1, 1000)
+    batch["ratio"][::10] = np.nan
+    batch["code"] = np.array(["a", "bb", "ccc", "dddd"])[np.arange(1000) % 4]
+    batch["flag"] = np.arange(1000) % 2 == 0
+
+    properties = infer_from_columns(batch).render()["properties"]
+
+    assert properties["id"] == {
+        "type": "integer",
+        "multipleOf": 4,
+        "minimum": -400,
+        "maximum": 3596,
+    }
+    assert properties["ratio"]["anyOf"][1] == {"type": "null"}
+    assert properties["ratio"]["anyOf"][0]["maximum"] == 1.0
+    ratio_from_list = infer_from_columns({"ratio": batch["ratio"].tolist()})
+    assert properties["ratio"] == ratio_from_list.render()["properties"]["ratio"]
+    assert properties["code"] == {
+        "type": "string",
+        "minLength": 1,
+        "maxLength": 4,
+        "enum": ["a", "bb", "ccc", "dddd"],
+    }
+    assert properties["flag"] == {"type": "boolean"}
+
+
+def test_infer_from_columns_unequal_lengths():
+    with pytest.raises(ValueError):
+        infer_from_columns({"a": [1, 2], "b": [1]})
+
+
+def test_infer_infinity_as_null():
+    np = pytest.importorskip("numpy")
+    inf = float("inf")
+    values = [1.0, 1.0, inf, -inf, 3.0, 3.0]
+    batch = np.array([(v,) for v in values], dtype=[("x", "f8")])
+
+    node = infer_from_samples([{"x": v} for v in values])
+    schema_instance = node.render()
+
+    assert schema_instance["properties"]["x"] == {
+        "anyOf": [
+            {"type": "number", "minimum": 1.0, "maximum": 3.0, "enum": [1.0, 3.0]},
+            {"type": "null"},
+        ]
+    }
+    assert json.dumps(schema_instance, allow_nan=False)
+    assert infer_from_columns({"x": values}) == node
+    assert infer_from_columns(batch) == node
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2.5, 1, 2.5],
+        [1.0, 1, 2.5, 2.5, 1],
+        [None, 1, 2.5, float("nan"), 1, 2.5],
+        [1, 2 ** 63, 1, 2 ** 63],
+        [-1, 2 ** 63, -1, 2 ** 63],
+        [1, 2 ** 70],
+        [2 ** 60, 0.5, 2 ** 60, 0.5],
+        [1e20, 3e20, 5e20, 7e20],
+    ],
+)
+def test_infer_from_number_column_equals_streaming_inference(values):
+    pytest.importorskip("numpy")
+
+    column_schema = infer_from_columns({"x": values}).render()
+    samples_schema = infer_from_samples([{"x": value} for value in values]).render()
+
+    # repr also tells integers from floats, e.g. 1 from 1.0
+    assert repr(column_schema) == repr(samples_schema)
+
+
+def test_infer_large_float_divisor_from_structured_array():
+    np = pytest.importorskip("numpy")
+    batch = np.array([(1e20,), (3e20,), (5e20,), (7e20,)], dtype=[("x", "f8")])
+
+    properties = infer_from_columns(batch).render()["properties"]
+
+    assert properties["x"]["multipleOf"] == 10 ** 20
@@ -1,6 +1,11 @@
 import json
 
+from jsbuilder.builder import JsonSchemaAnyOf
+from jsbuilder.builder import JsonSchemaInteger
+from jsbuilder.builder import JsonSchemaNull
+from jsbuilder.builder import JsonSchemaNumber
 from jsbuilder.builder import JsonSchemaObject
+from jsbuilder.builder import JsonSchemaString
 
 from .util import validate
 
@@ -25,3 +30,40 @@ def test_object_node_from_class():
     print(json.dumps(node.render(), indent=1))
 
     validate(schema_instance)
+
+
+def test_constrained_nodes_equal():
+    assert JsonSchemaInteger(minimum=0) == JsonSchemaInteger(minimum=0)
+    assert JsonSchemaNumber(multipleOf=0.5) == JsonSchemaNumber(multipleOf=0.5)
+    assert JsonSchemaString(enum=["a", "b"]) == JsonSchemaString(enum=["a", "b"])
+
+
+def test_constrained_nodes_not_equal():
+    assert JsonSchemaInteger(minimum=0) != JsonSchemaInteger(minimum=5)
+    assert JsonSchemaInteger(multipleOf=2) != JsonSchemaInteger()
+    assert JsonSchemaNumber(maximum=1) != JsonSchemaNumber(maximum=2)
+    assert JsonSchemaNumber(exact_type="integer") != JsonSchemaNumber()
+    assert JsonSchemaString(maxLength=3) != JsonSchemaString(maxLength=4)
+    assert JsonSchemaObject({"color": JsonSchemaString(enum=["red"])}) != (
+        JsonSchemaObject({"color": JsonSchemaString(enum=["blue"])})
+    )
+
+
+def test_nullable_nodes_equal():
+    assert JsonSchemaNull() == JsonSchemaNull()
+    assert JsonSchemaAnyOf([JsonSchemaString(), JsonSchemaNull()]) == (
+        JsonSchemaAnyOf([JsonSchemaString(), JsonSchemaNull()])
+    )
+    assert JsonSchemaObject({"a": JsonSchemaNull()}) == (
+        JsonSchemaObject({"a": JsonSchemaNull()})
+    )
+
+
+def test_nullable_nodes_not_equal():
+    assert JsonSchemaNull() != JsonSchemaString()
+    assert JsonSchemaAnyOf([JsonSchemaString(), JsonSchemaNull()]) != (
+        JsonSchemaAnyOf([JsonSchemaString(maxLength=2), JsonSchemaNull()])
+    )
+    assert JsonSchemaAnyOf([JsonSchemaInteger(), JsonSchemaNull()]) != (
+        JsonSchemaAnyOf([JsonSchemaInteger()])
+    )